@@ -1,5 +1,7 @@
 #!/bin/bash
 NODE_ID=$1
+# Interpreter for the node; e.g. PYTHON=pypy3 to run it under the PyPy JIT
+PYTHON="${PYTHON:-python3}"
 
 # Wait for apt lock to be released (in case user_data is still running)
 while fuser /var/lib/dpkg/lock-frontend >/dev/null 2>&1; do sleep 1; done
@@ -9,5 +11,5 @@ pkill -f node.py || true
 tmux has-session -t node 2>/dev/null && tmux kill-session -t node || true
 
 # Start new session
-tmux new-session -d -s node "USE_CLOUDWATCH=true AWS_REGION=us-east-1 python3 node.py --id $NODE_ID --peers peers.json | tee node.log"
+tmux new-session -d -s node "USE_CLOUDWATCH=true AWS_REGION=us-east-1 $PYTHON node.py --id $NODE_ID --peers peers.json | tee node.log"
 sleep 1
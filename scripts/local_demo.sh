@@ -5,21 +5,23 @@ set -euo pipefail
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 SRC_DIR="$SCRIPT_DIR/../src"
 SESSION_NAME="demo"
+# Interpreter for the nodes; e.g. PYTHON=pypy3 to run them under the PyPy JIT
+PYTHON="${PYTHON:-python3}"
 
 # Kill existing session if exists
 tmux has-session -t $SESSION_NAME 2>/dev/null && tmux kill-session -t $SESSION_NAME
 
 # Create new tmux session with first node
 cd "$SRC_DIR"
-tmux new-session -d -s $SESSION_NAME -n nodes "python3 node.py --id 1 --peers peers.json"
+tmux new-session -d -s $SESSION_NAME -n nodes "$PYTHON node.py --id 1 --peers peers.json"
 
 # Split and add remaining nodes
-tmux split-window -t $SESSION_NAME:nodes -h "cd $SRC_DIR && python3 node.py --id 2 --peers peers.json"
-tmux split-window -t $SESSION_NAME:nodes -v "cd $SRC_DIR && python3 node.py --id 3 --peers peers.json"
+tmux split-window -t $SESSION_NAME:nodes -h "cd $SRC_DIR && $PYTHON node.py --id 2 --peers peers.json"
+tmux split-window -t $SESSION_NAME:nodes -v "cd $SRC_DIR && $PYTHON node.py --id 3 --peers peers.json"
 tmux select-pane -t $SESSION_NAME:nodes.0
-tmux split-window -t $SESSION_NAME:nodes -v "cd $SRC_DIR && python3 node.py --id 4 --peers peers.json"
+tmux split-window -t $SESSION_NAME:nodes -v "cd $SRC_DIR && $PYTHON node.py --id 4 --peers peers.json"
 tmux select-pane -t $SESSION_NAME:nodes.2
-tmux split-window -t $SESSION_NAME:nodes -v "cd $SRC_DIR && python3 node.py --id 5 --peers peers.json"
+tmux split-window -t $SESSION_NAME:nodes -v "cd $SRC_DIR && $PYTHON node.py --id 5 --peers peers.json"
 
 # Set layout for better visibility
 tmux select-layout -t $SESSION_NAME:nodes tiled
@@ -21,17 +21,53 @@ Output:
     - benchmark_report.md with formatted report
 """
 
+import io
 import json
+import mmap
+import os
 import subprocess
 import sys
 import time
-from dataclasses import dataclass, field
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-
-@dataclass
+# Raw-byte markers for the event types analyze_logs consumes. Lines containing
+# none of them are skipped before they ever reach the JSON parser.
+EVENT_KEYWORDS = (
+    b'"MUTEX"',
+    b'"CS_ENTER"',
+    b'"ELECTION_START"',
+    b'"LEADER_UPDATE"',
+    b'"LEADER_SELF"',
+)
+
+# Every structured node log line carries this key; anything else is console noise
+EVENT_MARKER = b'"event_type"'
+
+# Event kinds stored in EventColumns.kinds
+EVT_REQUEST, EVT_CS_ENTER, EVT_ELECTION, EVT_COORD = range(4)
+EVENT_KINDS = {
+    "CS_ENTER": EVT_CS_ENTER,
+    "ELECTION_START": EVT_ELECTION,
+    "LEADER_UPDATE": EVT_COORD,
+    "LEADER_SELF": EVT_COORD,
+}
+
+# Simulated critical-section workload in node.py (3 x 1s), used to bound waits
+CS_DURATION = 3.0
+POLL_INTERVAL = 0.05
+STARTUP_TIMEOUT = 10.0
+ELECTION_WAIT_TIMEOUT = 15.0
+
+# Events a node logs once it knows the current leader
+LEADER_EVENTS = ("LEADER_SELF", "LEADER_UPDATE", "LEADER_RECOVER")
+
+
+@dataclass(slots=True)
 class BenchmarkResult:
     """Results from a single benchmark run."""
 
@@ -56,11 +92,8 @@ class BenchmarkResult:
     # CS entries
     cs_entries: int = 0
 
-    # Raw log lines for analysis
-    log_lines: list[dict[str, Any]] = field(default_factory=list) # type: ignore
-
 
-@dataclass
+@dataclass(slots=True)
 class NodeProcess:
     """Represents a running node process."""
 
@@ -69,6 +102,121 @@ class NodeProcess:
     log_file: Path
 
 
+@dataclass(slots=True)
+class EventColumns:
+    """Parsed events stored column-wise as (node_id, lamport_clock, kind)."""
+
+    node_ids: array[int] = field(default_factory=lambda: array("i"))
+    clocks: array[int] = field(default_factory=lambda: array("q"))
+    kinds: array[int] = field(default_factory=lambda: array("b"))
+
+    def append(self, node_id: int, clock: int, kind: int) -> None:
+        self.node_ids.append(node_id)
+        self.clocks.append(clock)
+        self.kinds.append(kind)
+
+    def extend(self, other: "EventColumns") -> None:
+        self.node_ids.extend(other.node_ids)
+        self.clocks.extend(other.clocks)
+        self.kinds.extend(other.kinds)
+
+    def count(self, kind: int) -> int:
+        return self.kinds.count(kind)
+
+
+@dataclass(slots=True)
+class ParsedLog:
+    """Per-node partial metrics extracted from a single log file."""
+
+    total_events: int = 0
+    events: EventColumns = field(default_factory=EventColumns)
+
+
+def _parse_one_log(path: Path, node_id: int) -> ParsedLog:
+    """Parse one node log file; runs in a worker process."""
+    parsed = ParsedLog()
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return parsed
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = mm.find(b"\n", start)
+                if end == -1:
+                    end = size
+                if mm[start : start + 1] != b"{":
+                    start = end + 1
+                    continue
+                line_start = start
+                start = end + 1
+
+                parsed.total_events += 1
+                # Search the map in place so only matching lines get copied out
+                if not any(
+                    mm.find(keyword, line_start, end) != -1
+                    for keyword in EVENT_KEYWORDS
+                ):
+                    continue
+                line = mm[line_start:end]
+
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                event_type = event.get("event_type", "")
+                if event_type == "MUTEX":
+                    if "Requesting" not in event.get("message", ""):
+                        continue
+                    kind = EVT_REQUEST
+                elif event_type in EVENT_KINDS:
+                    kind = EVENT_KINDS[event_type]
+                else:
+                    continue
+
+                parsed.events.append(
+                    event.get("node_id") or node_id,
+                    event.get("lamport_clock", 0),
+                    kind,
+                )
+
+    return parsed
+
+
+class LogTail:
+    """Incrementally reads JSON events appended to a node log file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.offset = 0
+        self._partial = b""
+
+    def read_events(self) -> list[dict[str, Any]]:
+        """Return events from complete lines written since the last call."""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return []
+        self.offset += len(chunk)
+
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()
+
+        events: list[dict[str, Any]] = []
+        for line in lines:
+            if not line.startswith(b"{") or EVENT_MARKER not in line:
+                continue
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return events
+
+
 class Benchmark:
     """Orchestrates benchmark runs across different configurations."""
 
@@ -129,25 +277,32 @@ class Benchmark:
             return result
 
         print(f"  Started {len(nodes)} nodes, waiting for stabilization...")
-        time.sleep(3)  # Wait for election to complete
+        tails = {node.node_id: LogTail(node.log_file) for node in nodes}
+        if not self.wait_for_leader(tails, ELECTION_WAIT_TIMEOUT):
+            print("  WARNING: not every node reported a leader")
 
         # Trigger initial election from highest node
         print("  Triggering initial election...")
         self.send_command(nodes[-1], "elect")
-        time.sleep(2)
+        highest = nodes[-1].node_id
+        if not self.wait_for_leader({highest: tails[highest]}, ELECTION_WAIT_TIMEOUT):
+            print(f"  WARNING: node {highest} did not announce itself as leader")
 
         # Send mutex requests from multiple nodes
         print(f"  Sending {self.num_requests} mutex requests...")
 
-        for i in range(self.num_requests):
-            node_idx = i % len(nodes)
-            node = nodes[node_idx]
-            self.send_command(node, "req")
-            time.sleep(0.5)  # Stagger requests slightly
+        for tail in tails.values():
+            tail.read_events()
+
+        self.send_commands(
+            [(nodes[i % len(nodes)], "req") for i in range(self.num_requests)]
+        )
 
         # Wait for all CS operations to complete
         print("  Waiting for critical section operations...")
-        time.sleep(num_nodes * 2)
+        timeout = self.num_requests * CS_DURATION + num_nodes * 2
+        if not self.wait_for_completion(list(tails.values()), timeout):
+            print(f"  WARNING: critical sections still pending after {timeout:.0f}s")
 
         # Stop all nodes
         print("  Stopping nodes...")
@@ -160,6 +315,50 @@ class Benchmark:
 
         return result
 
+    def wait_for_leader(self, tails: dict[int, LogTail], timeout: float) -> bool:
+        """Wait until every tailed node logs a leader event; False on timeout."""
+        pending = dict(tails)
+        deadline = time.monotonic() + timeout
+
+        while pending:
+            for node_id, tail in list(pending.items()):
+                if any(
+                    event.get("event_type") in LEADER_EVENTS
+                    for event in tail.read_events()
+                ):
+                    del pending[node_id]
+
+            if not pending:
+                break
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(POLL_INTERVAL)
+
+        return True
+
+    def wait_for_completion(self, tails: list[LogTail], timeout: float) -> bool:
+        """Wait until every logged mutex request has finished; False on timeout."""
+        requested = 0
+        finished = 0
+        deadline = time.monotonic() + timeout
+
+        while True:
+            for tail in tails:
+                for event in tail.read_events():
+                    event_type = event.get("event_type")
+                    if event_type == "MUTEX" and "Requesting" in event.get(
+                        "message", ""
+                    ):
+                        requested += 1
+                    elif event_type in ("CS_EXIT", "MUTEX_FAIL"):
+                        finished += 1
+
+            if requested and finished >= requested:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(POLL_INTERVAL)
+
     def start_nodes(self, num_nodes: int, peers_file: str) -> list[NodeProcess]:
         """Start node processes for the benchmark."""
         nodes: list[NodeProcess] = []
@@ -182,16 +381,43 @@ class Benchmark:
                     stderr=subprocess.STDOUT,
                     cwd=self.src_dir,
                     text=True,
-                    bufsize=1,
+                    bufsize=65536,
+                    # The benchmark holds no descriptors a node could misuse,
+                    # so skip the per-fd close sweep between fork and exec
+                    close_fds=False,
                 )
 
             nodes.append(
                 NodeProcess(node_id=node_id, process=process, log_file=log_file)
             )
-            time.sleep(0.3)  # Stagger node startup
+
+        if not self.wait_for_ready(nodes, STARTUP_TIMEOUT):
+            print(f"  WARNING: not all nodes reported ready within {STARTUP_TIMEOUT}s")
 
         return nodes
 
+    def wait_for_ready(self, nodes: list[NodeProcess], timeout: float) -> bool:
+        """Wait until every node has logged its startup event; False on timeout."""
+        tails = {node.node_id: LogTail(node.log_file) for node in nodes}
+        deadline = time.monotonic() + timeout
+
+        while tails:
+            for node_id, tail in list(tails.items()):
+                if any(
+                    event.get("event_type") == "SYSTEM"
+                    and event.get("message", "").endswith("started.")
+                    for event in tail.read_events()
+                ):
+                    del tails[node_id]
+
+            if not tails:
+                break
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(POLL_INTERVAL)
+
+        return True
+
     def send_command(self, node: NodeProcess, command: str) -> None:
         """Send a command to a node's stdin."""
         if node.process.stdin and node.process.poll() is None:
@@ -201,6 +427,23 @@ class Benchmark:
             except (BrokenPipeError, OSError):
                 pass
 
+    def send_commands(self, commands: list[tuple[NodeProcess, str]]) -> None:
+        """Write a batch of commands, then flush each node's stdin once."""
+        pending: dict[int, NodeProcess] = {}
+        for node, command in commands:
+            if node.process.stdin and node.process.poll() is None:
+                try:
+                    node.process.stdin.write(f"{command}\n")
+                    pending[node.node_id] = node
+                except (BrokenPipeError, OSError):
+                    pass
+
+        for node in pending.values():
+            try:
+                node.process.stdin.flush()  # type: ignore[union-attr]
+            except (BrokenPipeError, OSError):
+                pass
+
     def stop_nodes(self, nodes: list[NodeProcess]) -> None:
         """Gracefully stop all nodes."""
         for node in nodes:
@@ -223,51 +466,25 @@ class Benchmark:
         self, nodes: list[NodeProcess], result: BenchmarkResult
     ) -> BenchmarkResult:
         """Parse log files and extract metrics."""
-        all_events: list[dict[str, Any]] = []
-        cs_entries: list[dict[str, Any]] = []
-        cs_exits: list[dict[str, Any]] = []
-        mutex_requests: list[dict[str, Any]] = []
-
-        for node in nodes:
-            if not node.log_file.exists():
-                continue
-
-            with open(node.log_file, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or not line.startswith("{"):
-                        continue
+        events = EventColumns()
+
+        log_nodes = [node for node in nodes if node.log_file.exists()]
+        with ProcessPoolExecutor(max_workers=max(1, len(log_nodes))) as executor:
+            parsed_logs = list(
+                executor.map(
+                    _parse_one_log,
+                    [node.log_file for node in log_nodes],
+                    [node.node_id for node in log_nodes],
+                )
+            )
 
-                    try:
-                        event = json.loads(line)
-                        event["_node_id"] = node.node_id
-                        all_events.append(event)
-
-                        event_type = event.get("event_type", "")
-
-                        # Count message types based on event types
-                        if event_type == "MUTEX" and "Requesting" in event.get(
-                            "message", ""
-                        ):
-                            result.request_messages += 1
-                            mutex_requests.append(event)
-                        elif event_type == "CS_ENTER":
-                            cs_entries.append(event)
-                            result.cs_entries += 1
-                        elif event_type == "CS_EXIT":
-                            cs_exits.append(event)
-                        elif event_type == "ELECTION_START":
-                            result.election_messages += 1
-                        elif (
-                            event_type == "LEADER_UPDATE" or event_type == "LEADER_SELF"
-                        ):
-                            result.coordinator_messages += 1
-
-                    except json.JSONDecodeError:
-                        continue
+        for parsed in parsed_logs:
+            events.extend(parsed.events)
+            result.total_messages += parsed.total_events
 
-        result.log_lines = all_events
-        result.total_messages = len(all_events)
+        result.cs_entries = events.count(EVT_CS_ENTER)
+        result.election_messages = events.count(EVT_ELECTION)
+        result.coordinator_messages = events.count(EVT_COORD)
 
         # Calculate theoretical message counts for Ricart-Agrawala
         # For N nodes: each request sends N-1 REQUESTs and receives N-1 REPLYs
@@ -276,7 +493,7 @@ class Benchmark:
         result.request_messages = result.cs_entries * (n - 1)
 
         # Calculate CS wait times
-        wait_times = self.calculate_wait_times(mutex_requests, cs_entries)
+        wait_times = self.calculate_wait_times(events)
         if wait_times:
             result.avg_cs_wait_time = sum(wait_times) / len(wait_times)
             result.max_cs_wait_time = max(wait_times)
@@ -284,51 +501,40 @@ class Benchmark:
 
         return result
 
-    def calculate_wait_times(
-        self,
-        requests: list[dict[str, Any]],
-        entries: list[dict[str, Any]],
-    ) -> list[float]:
+    def calculate_wait_times(self, events: EventColumns) -> array[float]:
         """Calculate wait times between request and CS entry."""
-        wait_times: list[float] = []
-
-        # Group by node
-        requests_by_node: dict[int, list[dict[str, Any]]] = {}
-        entries_by_node: dict[int, list[dict[str, Any]]] = {}
-
-        for req in requests:
-            node_id: int = req.get("node_id") or req.get("_node_id") or 0
-            if node_id not in requests_by_node:
-                requests_by_node[node_id] = []
-            requests_by_node[node_id].append(req)
-
-        for entry in entries:
-            node_id = entry.get("node_id") or entry.get("_node_id") or 0
-            if node_id not in entries_by_node:
-                entries_by_node[node_id] = []
-            entries_by_node[node_id].append(entry)
-
-        # Match requests to entries by Lamport clock ordering
-        for node_id in requests_by_node:
-            node_requests = sorted(
-                requests_by_node.get(node_id, []),
-                key=lambda x: x.get("lamport_clock", 0),
-            )
-            node_entries = sorted(
-                entries_by_node.get(node_id, []),
-                key=lambda x: x.get("lamport_clock", 0),
-            )
-
-            for i, req in enumerate(node_requests):
-                if i < len(node_entries):
-                    entry = node_entries[i]
-                    req_clock = req.get("lamport_clock", 0)
-                    entry_clock = entry.get("lamport_clock", 0)
-                    # Approximate wait time based on clock difference
-                    # Each clock tick represents ~message exchange time
-                    clock_diff = entry_clock - req_clock
-                    estimated_wait = clock_diff * 0.1  # ~100ms per clock tick
-                    wait_times.append(max(0.1, estimated_wait))
+        node_ids, clocks, kinds = events.node_ids, events.clocks, events.kinds
+
+        def sorted_indices(kind: int) -> list[int]:
+            # Two stable sorts on int keys order by (node_id, lamport_clock)
+            # without building a tuple per event
+            indices = [idx for idx, k in enumerate(kinds) if k == kind]
+            indices.sort(key=clocks.__getitem__)
+            indices.sort(key=node_ids.__getitem__)
+            return indices
+
+        requests = sorted_indices(EVT_REQUEST)
+        entries = sorted_indices(EVT_CS_ENTER)
+
+        # Single merge pass over (node_id, lamport_clock)-sorted indices pairs
+        # each node's i-th request with its i-th CS entry
+        wait_times: array[float] = array("d")
+        i = j = 0
+        while i < len(requests) and j < len(entries):
+            req_node, req_clock = node_ids[requests[i]], clocks[requests[i]]
+            entry_node, entry_clock = node_ids[entries[j]], clocks[entries[j]]
+            if req_node < entry_node:
+                i += 1
+            elif req_node > entry_node:
+                j += 1
+            else:
+                # Approximate wait time based on clock difference
+                # Each clock tick represents ~message exchange time
+                clock_diff = entry_clock - req_clock
+                estimated_wait = clock_diff * 0.1  # ~100ms per clock tick
+                wait_times.append(max(0.1, estimated_wait))
+                i += 1
+                j += 1
 
         return wait_times
 
@@ -345,28 +551,9 @@ class Benchmark:
         """Generate final benchmark report."""
         # Save raw JSON results
         json_path = self.benchmark_dir / "benchmark_results.json"
-        with open(json_path, "w") as f:
-            json.dump(
-                [
-                    {
-                        "config_name": r.config_name,
-                        "num_nodes": r.num_nodes,
-                        "num_requests": r.num_requests,
-                        "total_messages": r.total_messages,
-                        "request_messages": r.request_messages,
-                        "reply_messages": r.reply_messages,
-                        "election_messages": r.election_messages,
-                        "coordinator_messages": r.coordinator_messages,
-                        "cs_entries": r.cs_entries,
-                        "avg_cs_wait_time": r.avg_cs_wait_time,
-                        "max_cs_wait_time": r.max_cs_wait_time,
-                        "min_cs_wait_time": r.min_cs_wait_time,
-                    }
-                    for r in self.results
-                ],
-                f,
-                indent=2,
-            )
+        json_path.write_text(
+            json.dumps([asdict(r) for r in self.results], indent=2)
+        )
         print(f"\nRaw results saved to: {json_path}")
 
         # Generate Markdown report
@@ -379,101 +566,107 @@ class Benchmark:
 
     def generate_markdown_report(self, path: Path) -> None:
         """Generate a Markdown formatted report."""
-        with open(path, "w") as f:
-            f.write("# Performance Benchmark Report\n\n")
-            f.write(
-                f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-            )
-            f.write("## Test Configuration\n\n")
-            f.write(f"- **Requests per configuration:** {self.num_requests}\n")
-            f.write("- **Algorithm:** Ricart-Agrawala Mutual Exclusion\n")
-            f.write("- **Election:** Bully Algorithm\n\n")
-
-            f.write("## Results Summary\n\n")
-            f.write(
-                "| Configuration | Nodes | CS Entries | Messages (REQ) | Messages (REPLY) | Avg Wait (s) | Max Wait (s) |\n"
-            )
-            f.write(
-                "|---------------|-------|------------|----------------|------------------|--------------|-------------|\n"
-            )
-
-            for r in self.results:
-                f.write(
-                    f"| {r.config_name} | {r.num_nodes} | {r.cs_entries} | "
-                    f"{r.request_messages} | {r.reply_messages} | "
-                    f"{r.avg_cs_wait_time:.3f} | {r.max_cs_wait_time:.3f} |\n"
-                )
+        buf = io.StringIO()
+        buf.write("# Performance Benchmark Report\n\n")
+        buf.write(
+            f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        )
+        buf.write("## Test Configuration\n\n")
+        buf.write(f"- **Requests per configuration:** {self.num_requests}\n")
+        buf.write("- **Algorithm:** Ricart-Agrawala Mutual Exclusion\n")
+        buf.write("- **Election:** Bully Algorithm\n\n")
+
+        buf.write("## Results Summary\n\n")
+        buf.write(
+            "| Configuration | Nodes | CS Entries | Messages (REQ) | Messages (REPLY) | Avg Wait (s) | Max Wait (s) |\n"
+        )
+        buf.write(
+            "|---------------|-------|------------|----------------|------------------|--------------|-------------|\n"
+        )
 
-            f.write("\n## Analysis\n\n")
-            f.write("### Message Complexity\n\n")
-            f.write(
-                "The Ricart-Agrawala algorithm has a message complexity of **2(N-1)** per critical section request:\n"
-            )
-            f.write("- N-1 REQUEST messages sent\n")
-            f.write("- N-1 REPLY messages received\n\n")
-
-            f.write("| Nodes | Expected Messages/Request | Observed |\n")
-            f.write("|-------|---------------------------|----------|\n")
-            for r in self.results:
-                expected = 2 * (r.num_nodes - 1)
-                observed = (
-                    (r.request_messages + r.reply_messages) // r.cs_entries
-                    if r.cs_entries > 0
-                    else 0
-                )
-                f.write(f"| {r.num_nodes} | {expected} | {observed} |\n")
-
-            f.write("\n### Scalability Observations\n\n")
-            if len(self.results) >= 2:
-                r1, r2 = self.results[0], self.results[-1]
-                if r1.avg_cs_wait_time > 0:
-                    wait_increase = (
-                        (r2.avg_cs_wait_time - r1.avg_cs_wait_time)
-                        / r1.avg_cs_wait_time
-                        * 100
-                    )
-                    f.write(
-                        f"- Wait time increased by **{wait_increase:.1f}%** from {r1.num_nodes} to {r2.num_nodes} nodes\n"
-                    )
-
-            f.write("\n## Conclusions\n\n")
-            f.write(
-                "1. Message complexity scales linearly with the number of nodes as expected for Ricart-Agrawala.\n"
-            )
-            f.write(
-                "2. Wait times increase with more nodes due to increased contention.\n"
-            )
-            f.write(
-                "3. The Bully election algorithm successfully elected leaders in all configurations.\n"
+        buf.write(
+            "".join(
+                f"| {r.config_name} | {r.num_nodes} | {r.cs_entries} | "
+                f"{r.request_messages} | {r.reply_messages} | "
+                f"{r.avg_cs_wait_time:.3f} | {r.max_cs_wait_time:.3f} |\n"
+                for r in self.results
             )
+        )
 
-    def print_final_table(self) -> None:
-        """Print a formatted table of results to console."""
-        print("\n" + "=" * 90)
-        print("FINAL RESULTS TABLE")
-        print("=" * 90)
-        print(
-            f"{'Config':<20} {'Nodes':>6} {'CS Entries':>12} {'REQ Msgs':>10} "
-            f"{'REPLY Msgs':>12} {'Avg Wait':>10} {'Max Wait':>10}"
+        buf.write("\n## Analysis\n\n")
+        buf.write("### Message Complexity\n\n")
+        buf.write(
+            "The Ricart-Agrawala algorithm has a message complexity of **2(N-1)** per critical section request:\n"
         )
-        print("-" * 90)
+        buf.write("- N-1 REQUEST messages sent\n")
+        buf.write("- N-1 REPLY messages received\n\n")
 
+        buf.write("| Nodes | Expected Messages/Request | Observed |\n")
+        buf.write("|-------|---------------------------|----------|\n")
         for r in self.results:
-            print(
-                f"{r.config_name:<20} {r.num_nodes:>6} {r.cs_entries:>12} "
-                f"{r.request_messages:>10} {r.reply_messages:>12} "
-                f"{r.avg_cs_wait_time:>10.3f}s {r.max_cs_wait_time:>10.3f}s"
+            expected = 2 * (r.num_nodes - 1)
+            observed = (
+                (r.request_messages + r.reply_messages) // r.cs_entries
+                if r.cs_entries > 0
+                else 0
             )
+            buf.write(f"| {r.num_nodes} | {expected} | {observed} |\n")
+
+        buf.write("\n### Scalability Observations\n\n")
+        if len(self.results) >= 2:
+            r1, r2 = self.results[0], self.results[-1]
+            if r1.avg_cs_wait_time > 0:
+                wait_increase = (
+                    (r2.avg_cs_wait_time - r1.avg_cs_wait_time)
+                    / r1.avg_cs_wait_time
+                    * 100
+                )
+                buf.write(
+                    f"- Wait time increased by **{wait_increase:.1f}%** from {r1.num_nodes} to {r2.num_nodes} nodes\n"
+                )
 
-        print("-" * 90)
-        print(
-            "\nMessage complexity analysis (Ricart-Agrawala: 2(N-1) messages per CS request):"
+        buf.write("\n## Conclusions\n\n")
+        buf.write(
+            "1. Message complexity scales linearly with the number of nodes as expected for Ricart-Agrawala.\n"
+        )
+        buf.write(
+            "2. Wait times increase with more nodes due to increased contention.\n"
+        )
+        buf.write(
+            "3. The Bully election algorithm successfully elected leaders in all configurations.\n"
         )
-        for r in self.results:
-            expected = 2 * (r.num_nodes - 1)
-            print(f"  {r.num_nodes} nodes: Expected {expected} msgs/request")
 
-        print("\n" + "=" * 90)
+        path.write_text(buf.getvalue())
+
+    def print_final_table(self) -> None:
+        """Print a formatted table of results to console."""
+        lines = [
+            "",
+            "=" * 90,
+            "FINAL RESULTS TABLE",
+            "=" * 90,
+            f"{'Config':<20} {'Nodes':>6} {'CS Entries':>12} {'REQ Msgs':>10} "
+            f"{'REPLY Msgs':>12} {'Avg Wait':>10} {'Max Wait':>10}",
+            "-" * 90,
+        ]
+        lines += [
+            f"{r.config_name:<20} {r.num_nodes:>6} {r.cs_entries:>12} "
+            f"{r.request_messages:>10} {r.reply_messages:>12} "
+            f"{r.avg_cs_wait_time:>10.3f}s {r.max_cs_wait_time:>10.3f}s"
+            for r in self.results
+        ]
+        lines += [
+            "-" * 90,
+            "",
+            "Message complexity analysis (Ricart-Agrawala: 2(N-1) messages per CS request):",
+        ]
+        lines += [
+            f"  {r.num_nodes} nodes: Expected {2 * (r.num_nodes - 1)} msgs/request"
+            for r in self.results
+        ]
+        lines += ["", "=" * 90]
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> None:
@@ -1,14 +1,65 @@
 """CloudWatch logging integration for distributed nodes."""
 
+import atexit
+import functools
 import json
 import logging
 import os
+import queue
 import sys
 import threading
 import time
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-import boto3
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+# PutLogEvents service limits for a single batch
+MAX_BATCH_EVENTS = 10_000
+MAX_BATCH_BYTES = 1_048_576
+EVENT_OVERHEAD_BYTES = 26
+FLUSH_INTERVAL = 5.0
+
+# Coalescing window per batch; keeps PutLogEvents well under the 5 TPS limit
+BATCH_WINDOW = 0.25
+# Events buffered beyond this are dropped rather than blocking the caller
+MAX_QUEUED_EVENTS = 10_000
+
+# Compact JSON: no padding after "," and ":" in every console and CloudWatch line
+JSON_SEPARATORS = (",", ":")
+
+# (created, event_type, message, lamport_clock, extra fields) awaiting formatting
+PendingEvent = tuple[float, str, str, int, dict[str, Any]]
+
+
+def _dumps_stdlib(data: dict[str, Any]) -> str:
+    return json.dumps(data, separators=JSON_SEPARATORS)
+
+
+def _dumps_orjson(data: dict[str, Any]) -> str:
+    # orjson output is already compact, like the stdlib encoding above
+    return orjson.dumps(data).decode()
+
+
+dumps_log: Callable[[dict[str, Any]], str] = (
+    _dumps_orjson if orjson is not None else _dumps_stdlib
+)
+# Separator dumps_log puts between object members, used to splice cached fields
+MEMBER_SEPARATOR = JSON_SEPARATORS[0]
+
+
+@functools.lru_cache(maxsize=None)
+def shared_logs_client(region: str) -> Any:
+    """Return the process-wide CloudWatch Logs client for a region.
+
+    boto3 is imported on first use so nodes running without CloudWatch never
+    pay for it, and loggers in one process share a client and its connections.
+    """
+    import boto3
+
+    return boto3.client("logs", region_name=region)
 
 
 class CloudWatchLogger:
@@ -35,14 +86,35 @@ class CloudWatchLogger:
         self.enabled = enabled
 
         self.cw_client = None
+        self._region = region or os.environ.get("AWS_REGION", "us-east-1")
         self.sequence_token: Optional[str] = None
+        self._queue: queue.Queue[Optional[tuple[int, str]]] = queue.Queue(
+            maxsize=MAX_QUEUED_EVENTS
+        )
+        self._dropped_events = 0
+        self._pending: queue.Queue[Optional[PendingEvent]] = queue.Queue(
+            maxsize=MAX_QUEUED_EVENTS
+        )
+        self._dropped_pending = 0
+        # (whole second, encoded node_id/timestamp_iso members) reused until the
+        # second rolls over; only the per-event fields are encoded each call
+        self._prefix_cache: tuple[int, str] = (-1, "")
+        self._worker: Optional[threading.Thread] = None
 
         # Setup console logger for local output
         self.logger = self._setup_console_logger()
+        self._stdout_write = sys.stdout.write
+        self._stdout_flush = sys.stdout.flush
+
+        # log_event only enqueues; this thread pays for JSON encoding and output
+        self._formatter = threading.Thread(target=self._run_formatter, daemon=True)
+        self._formatter.start()
+        atexit.register(self.close)
 
-        # Initialize CloudWatch client if enabled
+        # The client itself is created by the worker before its first batch
         if self.enabled:
-            self._initialize_cloudwatch(region)
+            self._worker = threading.Thread(target=self._run_worker, daemon=True)
+            self._worker.start()
 
     def _setup_console_logger(self) -> logging.Logger:
         """Configure JSON logging to stdout."""
@@ -53,48 +125,101 @@ class CloudWatchLogger:
         logger.addHandler(handler)
         return logger
 
-    def _initialize_cloudwatch(self, region: Optional[str]) -> None:
-        """Initialize CloudWatch client and create log group/stream if needed."""
+    def _initialize_cloudwatch(self) -> bool:
+        """Initialize CloudWatch client and create log group/stream if needed.
+
+        Runs on the worker thread, so node startup never waits on boto3 or AWS.
+        """
         try:
-            aws_region = region or os.environ.get("AWS_REGION", "us-east-1")
-            self.cw_client = boto3.client("logs", region_name=aws_region)
+            cw_client = shared_logs_client(self._region)
+
+            # Resolve modeled exception classes once instead of per call
+            errors = cw_client.exceptions
+            self._already_exists_error = errors.ResourceAlreadyExistsException
+            self._invalid_token_error = errors.InvalidSequenceTokenException
 
             # Create log group if it doesn't exist
             try:
-                self.cw_client.create_log_group(logGroupName=self.log_group)
-            except self.cw_client.exceptions.ResourceAlreadyExistsException:
+                cw_client.create_log_group(logGroupName=self.log_group)
+            except self._already_exists_error:
                 pass
 
             # Create log stream if it doesn't exist
             try:
-                self.cw_client.create_log_stream(
+                cw_client.create_log_stream(
                     logGroupName=self.log_group, logStreamName=self.log_stream
                 )
-            except self.cw_client.exceptions.ResourceAlreadyExistsException:
+            except self._already_exists_error:
                 pass
 
+            self.cw_client = cw_client
             self.logger.info(
-                f"CloudWatch logging enabled for Node {self.node_id} in region {aws_region}"
+                f"CloudWatch logging enabled for Node {self.node_id} in region {self._region}"
             )
+            return True
         except Exception as e:
             self.logger.warning(f"Failed to initialize CloudWatch: {e}")
             self.cw_client = None
             self.enabled = False
+            return False
 
     def log_event(
         self, event_type: str, message: str, lamport_clock: int, **kwargs: Any
     ) -> None:
-        """Emit a structured log entry and forward to CloudWatch when enabled."""
-        log_data: dict[str, Any] = {
-            "node_id": self.node_id,
-            "timestamp_iso": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()),
+        """Queue a structured log entry for the formatter thread.
+
+        Encoding and output happen off the caller's thread. Once the formatter
+        has stopped, entries are written inline so nothing is lost at shutdown.
+        """
+        event: PendingEvent = (time.time(), event_type, message, lamport_clock, kwargs)
+        if not self._formatter.is_alive():
+            self._write_event(event)
+            return
+        try:
+            self._pending.put_nowait(event)
+        except queue.Full:
+            self._dropped_pending += 1
+
+    def _run_formatter(self) -> None:
+        """Encode queued events as JSON lines until the stop sentinel arrives."""
+        while True:
+            event = self._pending.get()
+            if event is None:
+                return
+            if self._dropped_pending:
+                print(
+                    f"LOG WARNING: dropped {self._dropped_pending} events (queue full)",
+                    file=sys.stderr,
+                )
+                self._dropped_pending = 0
+            self._write_event(event)
+
+    def _write_event(self, event: PendingEvent) -> None:
+        created, event_type, message, lamport_clock, kwargs = event
+        event_data: dict[str, Any] = {
             "lamport_clock": lamport_clock,
             "event_type": event_type,
             "message": message,
             **kwargs,
         }
-        json_log = json.dumps(log_data)
-        self.log(json_log)
+        # Splice the cached leading members onto the encoded event ("{" dropped)
+        json_log = self._static_prefix(created) + dumps_log(event_data)[1:]
+        self._emit(json_log, created)
+
+    def _static_prefix(self, created: float) -> str:
+        """Return the encoded node_id/timestamp_iso members, rebuilt each second."""
+        second = int(created)
+        cached_second, prefix = self._prefix_cache
+        if second != cached_second:
+            static_data = {
+                "node_id": self.node_id,
+                "timestamp_iso": time.strftime(
+                    "%Y-%m-%dT%H:%M:%S", time.gmtime(second)
+                ),
+            }
+            prefix = dumps_log(static_data)[:-1] + MEMBER_SEPARATOR
+            self._prefix_cache = (second, prefix)
+        return prefix
 
     def log(self, json_log: str) -> None:
         """Log a JSON message to console and optionally CloudWatch.
@@ -102,31 +227,100 @@ class CloudWatchLogger:
         Args:
             json_log: JSON-formatted log message string
         """
-        # Always log to console
-        self.logger.info(json_log)
+        self._emit(json_log, time.time())
 
-        # Forward to CloudWatch in background if enabled
-        if self.enabled and self.cw_client:
-            threading.Thread(
-                target=self._send_to_cloudwatch, args=(json_log,), daemon=True
-            ).start()
+    def _emit(self, json_log: str, created: float) -> None:
+        """Write a formatted line to the console and queue it for CloudWatch."""
+        # Always log to console; structured lines bypass the logging machinery
+        self._stdout_write(json_log + "\n")
+        self._stdout_flush()
+
+        # Hand off to the batching worker if enabled
+        if self.enabled:
+            try:
+                self._queue.put_nowait((int(created * 1000), json_log))
+            except queue.Full:
+                self._dropped_events += 1
 
-    def _send_to_cloudwatch(self, json_log: str) -> None:
-        """Push a single log entry to CloudWatch, handling sequence tokens.
+    def close(self) -> None:
+        """Stop the formatter and batching worker after both flush their queues."""
+        if self._formatter.is_alive():
+            try:
+                self._pending.put(None, timeout=FLUSH_INTERVAL)
+            except queue.Full:
+                pass
+            else:
+                self._formatter.join(timeout=FLUSH_INTERVAL)
+        if self._worker is None or not self._worker.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=FLUSH_INTERVAL)
+        except queue.Full:
+            return
+        self._worker.join(timeout=FLUSH_INTERVAL * 2)
+
+    def _run_worker(self) -> None:
+        """Drain the queue and forward coalesced batches to CloudWatch."""
+        running = True
+        while running:
+            try:
+                item = self._queue.get(timeout=FLUSH_INTERVAL)
+            except queue.Empty:
+                continue
+            if item is None:
+                break
+
+            batch = [item]
+            batch_bytes = len(item[1]) + EVENT_OVERHEAD_BYTES
+            deadline = time.monotonic() + BATCH_WINDOW
+            while len(batch) < MAX_BATCH_EVENTS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                item_bytes = len(item[1]) + EVENT_OVERHEAD_BYTES
+                if batch_bytes + item_bytes > MAX_BATCH_BYTES:
+                    self._send_batch(batch)
+                    batch, batch_bytes = [], 0
+                batch.append(item)
+                batch_bytes += item_bytes
+
+            self._send_batch(batch)
+
+    def _send_batch(self, batch: list[tuple[int, str]]) -> None:
+        """Push a batch of log entries to CloudWatch, handling sequence tokens.
 
         Args:
-            json_log: JSON-formatted log message string
+            batch: (timestamp_ms, JSON log message) pairs
         """
-        if not self.cw_client:
+        if not self.enabled or not batch:
+            return
+        if self.cw_client is None and not self._initialize_cloudwatch():
             return
 
+        if self._dropped_events:
+            print(
+                f"CLOUDWATCH WARNING: dropped {self._dropped_events} events (queue full)",
+                file=sys.stderr,
+            )
+            self._dropped_events = 0
+
+        # PutLogEvents requires events in chronological order
+        log_events = [
+            {"timestamp": ts, "message": message} for ts, message in sorted(batch)
+        ]
+
         try:
             log_kwargs: dict[str, Any] = {
                 "logGroupName": self.log_group,
                 "logStreamName": self.log_stream,
-                "logEvents": [
-                    {"timestamp": int(time.time() * 1000), "message": json_log}
-                ],
+                "logEvents": log_events,
             }
 
             if self.sequence_token:
@@ -135,7 +329,7 @@ class CloudWatchLogger:
             response = self.cw_client.put_log_events(**log_kwargs)
             self.sequence_token = response.get("nextSequenceToken")
 
-        except self.cw_client.exceptions.InvalidSequenceTokenException as e:
+        except self._invalid_token_error as e:
             # Extract the correct token from error message and retry
             msg = e.response.get("Error", {}).get("Message", "")
             token = msg.split()[-1] if msg else None
@@ -146,9 +340,7 @@ class CloudWatchLogger:
                     response = self.cw_client.put_log_events(
                         logGroupName=self.log_group,
                         logStreamName=self.log_stream,
-                        logEvents=[
-                            {"timestamp": int(time.time() * 1000), "message": json_log}
-                        ],
+                        logEvents=log_events,
                         sequenceToken=self.sequence_token,
                     )
                     self.sequence_token = response.get("nextSequenceToken")
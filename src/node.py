@@ -1,110 +1,205 @@
 """Distributed node with Ricart-Agrawala mutex and bully election."""
 
 import argparse
+import itertools
 import json
+import math
 import os
+import queue
 import random
+import selectors
 import signal
 import socket
 import struct
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+from enum import IntEnum
+from typing import Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
 
 from cloudwatch_logger import CloudWatchLogger
 
-HEARTBEAT_INTERVAL = 2.0
-ELECTION_TIMEOUT = 5.0
+HEARTBEAT_INTERVAL = 0.5
+ELECTION_TIMEOUT = 3.0
 MUTEX_REPLY_TIMEOUT = 5.0
+# Election timeout is mean RTT plus this many standard deviations, then jittered
+RTT_STDDEV_FACTOR = 4.0
+MIN_ELECTION_TIMEOUT = 0.25
+# A few slow outliers must not stretch failover past the static timeout
+MAX_ELECTION_TIMEOUT = ELECTION_TIMEOUT
+# Seconds to wait for a TCP connect to a peer
+CONNECT_TIMEOUT = 2.0
+# Each follower draws its leader timeout once from 7-15 heartbeat intervals
+# (Raft's ratio), so followers don't all give up on a leader together
+LEADER_TIMEOUT_MIN_HEARTBEATS = 7
+LEADER_TIMEOUT_MAX_HEARTBEATS = 15
+# A hung connect must never look like a dead leader
+MIN_LEADER_TIMEOUT = 1.5 * CONNECT_TIMEOUT
+# Seconds between background reconnect attempts to a peer after a failed send
+RECONNECT_BACKOFF = (0.5, 1.0, 2.0, 4.0)
+# At most one CONNECTION_ERROR log per peer in this many seconds
+CONNECTION_ERROR_LOG_INTERVAL = 5.0
+# TCP keepalive probing: idle seconds, seconds between probes, probes before reset
+KEEPALIVE_IDLE = 5
+KEEPALIVE_INTERVAL = 2
+KEEPALIVE_COUNT = 3
+
+# Fixed-size wire frame: type code, sender id, Lamport timestamp, extra payload
+MSG_FRAME = struct.Struct(">BIIQ")
+RECV_BUFFER_SIZE = 65536
+
+
+def configure_peer_socket(sock: socket.socket) -> None:
+    """Disable Nagle and enable fast keepalive probing on a peer connection."""
+    # Frames are tiny; don't let Nagle hold them back
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # The probe tuning options are Linux-only
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_COUNT)
+
+
+class MessageType(IntEnum):
+    """Protocol message kinds exchanged between nodes.
+
+    The value is the type byte carried in MSG_FRAME.
+    """
 
+    REQUEST = 0
+    REPLY = 1
+    ELECTION = 2
+    ANSWER = 3
+    COORDINATOR = 4
+    HEARTBEAT = 5
 
-def send_bytes(sock: socket.socket, data: bytes) -> None:
-    length_prefix = struct.pack(">I", len(data))
-    sock.sendall(length_prefix + data)
 
+class NodeState(IntEnum):
+    """Mutex state used by Ricart-Agrawala mutual exclusion."""
 
-def recv_exact(sock: socket.socket, n: int) -> Optional[bytes]:
-    data = b""
-    while len(data) < n:
-        try:
-            packet = sock.recv(n - len(data))
-            if not packet:
-                return None
-            data += packet
-        except socket.error:
-            return None
-    return data
+    RELEASED = 0
+    WANTED = 1
+    HELD = 2
 
 
-class MessageType(Enum):
-    """Protocol message kinds exchanged between nodes."""
+class PeerAddress(NamedTuple):
+    ip: str
+    port: int
 
-    REQUEST = "REQUEST"
-    REPLY = "REPLY"
-    ELECTION = "ELECTION"
-    ANSWER = "ANSWER"
-    COORDINATOR = "COORDINATOR"
-    HEARTBEAT = "HEARTBEAT"
 
+class LiveView(NamedTuple):
+    """Live-peer data derived from one dead_nodes snapshot, swapped as one."""
 
-class NodeState(Enum):
-    """Mutex state used by Ricart-Agrawala mutual exclusion."""
+    dead: frozenset[int]
+    peers: Tuple[int, ...]
+    mask: int
+    higher: Tuple[int, ...]
 
-    RELEASED = "RELEASED"
-    WANTED = "WANTED"
-    HELD = "HELD"
 
+def resolve_peer(address: PeerAddress) -> Tuple[str, int]:
+    """Resolve a peer to an IPv4 socket address, keeping the raw host on failure."""
+    try:
+        infos = socket.getaddrinfo(
+            address.ip, address.port, socket.AF_INET, socket.SOCK_STREAM
+        )
+    except socket.gaierror:
+        return (address.ip, address.port)
+    return infos[0][4]
 
-class PeerAddress(NamedTuple):
-    ip: str
-    port: int
+
+class RttEstimator:
+    """Running mean and variance of round-trip times (Welford)."""
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    def add(self, sample: float) -> None:
+        with self._lock:
+            self._count += 1
+            delta = sample - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (sample - self._mean)
+
+    def timeout(self, fallback: float) -> float:
+        """Return mean + s*stddev clamped to the election bounds, or the fallback
+        until two samples exist."""
+        with self._lock:
+            if self._count < 2:
+                return fallback
+            stddev = math.sqrt(self._m2 / (self._count - 1))
+            estimate = self._mean + RTT_STDDEV_FACTOR * stddev
+        return min(max(estimate, MIN_ELECTION_TIMEOUT), MAX_ELECTION_TIMEOUT)
+
+
+@dataclass
+class ConnectionBuffer:
+    """Preallocated receive buffer for one inbound connection."""
+
+    buffer: bytearray = field(default_factory=lambda: bytearray(RECV_BUFFER_SIZE))
+    view: memoryview = field(init=False)
+    filled: int = 0
+
+    def __post_init__(self) -> None:
+        self.view = memoryview(self.buffer)
 
 
 @dataclass
 class ElectionState:
     coordinator_id: Optional[int] = None
     in_progress: bool = False
-    received_answer: bool = False
-    last_heartbeat: float = field(default_factory=time.time)
+    # Set by the first ANSWER so the initiator stops waiting as soon as one arrives
+    answered: threading.Event = field(default_factory=threading.Event)
+    # Set whenever coordinator_id changes so the heartbeat loop re-evaluates
+    leader_changed: threading.Event = field(default_factory=threading.Event)
+    last_heartbeat: float = field(default_factory=time.monotonic)
 
 
 class ThreadSafeSet:
-    """Thread-safe set for tracking nodes."""
+    """Copy-on-write set for tracking nodes; readers never take the lock."""
 
     def __init__(self) -> None:
-        self._set: set[int] = set()
+        self._set: frozenset[int] = frozenset()
         self._lock: threading.Lock = threading.Lock()
 
-    def add(self, item: int) -> None:
+    def add(self, item: int) -> bool:
+        """Add item; only the caller that actually inserted it gets True."""
+        if item in self._set:
+            return False
         with self._lock:
-            self._set.add(item)
+            if item in self._set:
+                return False
+            self._set = self._set | {item}
+        return True
 
     def discard(self, item: int) -> None:
+        if item not in self._set:
+            return
         with self._lock:
-            self._set.discard(item)
+            self._set = self._set - {item}
 
     def __contains__(self, item: int) -> bool:
-        with self._lock:
-            return item in self._set
+        return item in self._set
 
     def __len__(self) -> int:
-        with self._lock:
-            return len(self._set)
+        return len(self._set)
 
-    def snapshot(self) -> set[int]:
-        with self._lock:
-            return set(self._set)
+    def snapshot(self) -> frozenset[int]:
+        return self._set
 
 
 class DistributedNode:
     """Cluster node with TCP messaging, election, and mutex coordination.
 
-    Lock hierarchy (outer to inner): conn_lock -> dead_nodes lock -> mutex_lock
-    -> clock_lock. Acquire in this order when multiple locks are needed to
-    avoid deadlocks.
+    Lock hierarchy (outer to inner): dead_nodes lock -> mutex_lock ->
+    clock_lock. Acquire in this order when multiple locks are needed to avoid
+    deadlocks. election_lock only guards the start of an election and is never
+    held together with another lock.
     """
 
     def __init__(
@@ -115,21 +210,60 @@ class DistributedNode:
         self.port: int = local_port
 
         self.lamport_clock: int = 0
+        self._clock_counter: Iterator[int] = itertools.count(1)
         self.clock_lock: threading.Lock = threading.Lock()
 
         self.state: NodeState = NodeState.RELEASED
-        self.deferred_replies: list[int] = []
-        self.replies_received: set[int] = set()
+        self.deferred_replies: set[int] = set()
+        # Bit per peer (see _peer_bit) set once that peer has replied
+        self.replies_mask: int = 0
         self.request_clock: int = 0
         self.mutex_lock: threading.Lock = threading.Lock()
-        self.received_replies_event: threading.Event = threading.Event()
+        # Notified under mutex_lock whenever the reply set may have become complete
+        self.replies_cond: threading.Condition = threading.Condition(self.mutex_lock)
 
         self.election_state: ElectionState = ElectionState()
+        self.election_lock: threading.Lock = threading.Lock()
+        self.rtt: RttEstimator = RttEstimator()
+        self._election_sent_at: Dict[int, float] = {}
+        # Per-node generator: jitter streams differ between nodes by construction
+        self._rng: random.Random = random.Random(node_id)
+        self._leader_timeout: float = max(
+            HEARTBEAT_INTERVAL
+            * self._rng.uniform(
+                LEADER_TIMEOUT_MIN_HEARTBEATS, LEADER_TIMEOUT_MAX_HEARTBEATS
+            ),
+            MIN_LEADER_TIMEOUT,
+        )
 
-        self.peer_connections: Dict[int, socket.socket] = {}
-        self.conn_lock: threading.Lock = threading.Lock()
+        # Resolved once here so connects never block on DNS in the send path
+        self._peer_sockaddr: Dict[int, Tuple[str, int]] = {
+            pid: resolve_peer(address)
+            for pid, address in self.peers.items()
+            if pid != self.node_id
+        }
         self.dead_nodes: ThreadSafeSet = ThreadSafeSet()
+        self._last_connection_error: Dict[int, float] = {}
+        self._other_peers: Tuple[int, ...] = tuple(
+            sorted(pid for pid in self.peers if pid != self.node_id)
+        )
+        self._peer_bit: Dict[int, int] = {
+            pid: 1 << index for index, pid in enumerate(self._other_peers)
+        }
+        self._live_peers: LiveView = self._build_live_view(self.dead_nodes.snapshot())
         self.shared_counter: int = 0
+        # One FIFO queue and writer thread per peer; the writer owns the only
+        # outbound socket to that peer, so a slow peer only delays its own
+        # frames and they go out in order. None stops the writer
+        self._send_queues: Dict[
+            int, queue.SimpleQueue[Optional[Tuple[MessageType, bytes]]]
+        ] = {pid: queue.SimpleQueue() for pid in self._other_peers}
+
+        self._reconnect_exec: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="reconnect"
+        )
+        self._reconnecting: set[int] = set()
+        self._reconnect_lock: threading.Lock = threading.Lock()
 
         self.server_socket: socket.socket = socket.socket(
             socket.AF_INET, socket.SOCK_STREAM
@@ -142,152 +276,311 @@ class DistributedNode:
         use_cloudwatch = os.environ.get("USE_CLOUDWATCH", "False").lower() == "true"
         self.cw_logger = CloudWatchLogger(node_id=self.node_id, enabled=use_cloudwatch)
 
+        handlers: Dict[MessageType, Callable[[int, int], None]] = {
+            MessageType.REQUEST: self.handle_request,
+            MessageType.REPLY: self.handle_reply,
+            MessageType.ELECTION: self.handle_election,
+            MessageType.COORDINATOR: self.handle_coordinator,
+            MessageType.ANSWER: self.handle_answer,
+            MessageType.HEARTBEAT: self.handle_heartbeat,
+        }
+        self._handlers: Tuple[Callable[[int, int], None], ...] = tuple(
+            handlers[msg_type] for msg_type in MessageType
+        )
+
         self.running: bool = True
 
+        for pid, send_queue in self._send_queues.items():
+            threading.Thread(
+                target=self._run_sender,
+                args=(pid, send_queue),
+                name=f"sender-{pid}",
+                daemon=True,
+            ).start()
+
     # --- Lamport Clock ---
     def tick(self) -> int:
-        with self.clock_lock:
-            self.lamport_clock += 1
-        return self.lamport_clock
+        # next() on itertools.count is atomic under the GIL, so no lock needed
+        value = next(self._clock_counter)
+        self.lamport_clock = value
+        return value
 
     def update_clock(self, received_time: int) -> None:
+        if received_time < self.lamport_clock:
+            self.tick()
+            return
+        # Slow path: jump the counter forward past the received timestamp
         with self.clock_lock:
-            self.lamport_clock = max(self.lamport_clock, received_time) + 1
+            current = next(self._clock_counter)
+            if received_time >= current:
+                self._clock_counter = itertools.count(received_time + 2)
+                current = received_time + 1
+            self.lamport_clock = current
+
+    def _build_live_view(self, dead_snapshot: frozenset[int]) -> LiveView:
+        live = tuple(pid for pid in self._other_peers if pid not in dead_snapshot)
+        mask = 0
+        for pid in live:
+            mask |= self._peer_bit[pid]
+        higher = tuple(pid for pid in live if pid > self.node_id)
+        return LiveView(dead_snapshot, live, mask, higher)
+
+    def _live_view(self) -> LiveView:
+        dead_snapshot = self.dead_nodes.snapshot()
+        view = self._live_peers
+        if dead_snapshot is not view.dead:
+            view = self._build_live_view(dead_snapshot)
+            self._live_peers = view
+        return view
+
+    def live_peers(self) -> Tuple[int, ...]:
+        """Peers not marked dead, rebuilt only when the dead set changes."""
+        return self._live_view().peers
 
-    def _expected_replies(self) -> int:
-        return max(0, len(self.peers) - 1 - len(self.dead_nodes))
+    def higher_live_peers(self) -> Tuple[int, ...]:
+        """Live peers with a higher id than this node, the bully election targets."""
+        return self._live_view().higher
+
+    def _live_mask(self) -> int:
+        return self._live_view().mask
 
     # --- Connections & Messaging ---
-    def _get_connection(self, target_id: int) -> Optional[socket.socket]:
-        """Open or reuse a TCP connection to a peer."""
-        with self.conn_lock:
-            if target_id in self.peer_connections:
-                return self.peer_connections[target_id]
-
-            if target_id not in self.peers:
-                return None
-
-            peer_address = self.peers[target_id]
-            target_ip = peer_address.ip
-            target_port = peer_address.port
-            try:
-                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                s.settimeout(2.0)
-                s.connect((target_ip, target_port))
-                s.settimeout(None)
-                self.peer_connections[target_id] = s
-                self.dead_nodes.discard(target_id)
-                return s
-            except Exception as e:
-                if target_id not in self.dead_nodes:
-                    self.cw_logger.log_event(
-                        "CONNECTION_ERROR",
-                        f"Failed to connect to Node {target_id}",
-                        self.lamport_clock,
-                        error=str(e),
-                    )
-                return None
-
-    def _try_send(self, target_id: int, json_data: bytes) -> bool:
-        sock = self._get_connection(target_id)
-        if not sock:
-            return False
+    def _connect(self, target_id: int) -> Optional[socket.socket]:
+        """Open a new connection to a peer, marking it alive on success."""
         try:
-            send_bytes(sock, json_data)
-            return True
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            s.settimeout(CONNECT_TIMEOUT)
+            s.connect(self._peer_sockaddr[target_id])
+            s.settimeout(None)
+            configure_peer_socket(s)
+            self.dead_nodes.discard(target_id)
+            return s
+        except Exception as e:
+            now = time.monotonic()
+            last_logged = self._last_connection_error.get(target_id, -math.inf)
+            if (
+                target_id not in self.dead_nodes
+                and now - last_logged >= CONNECTION_ERROR_LOG_INTERVAL
+            ):
+                self._last_connection_error[target_id] = now
+                self.cw_logger.log_event(
+                    "CONNECTION_ERROR",
+                    f"Failed to connect to Node {target_id}",
+                    self.lamport_clock,
+                    error=str(e),
+                )
+            return None
+
+    def _send_on(self, sock: socket.socket, frame: bytes) -> bool:
+        try:
+            sock.sendall(frame)
         except (BrokenPipeError, ConnectionResetError, socket.error):
-            with self.conn_lock:
-                if target_id in self.peer_connections:
-                    try:
-                        self.peer_connections[target_id].close()
-                    except Exception:
-                        pass
-                    del self.peer_connections[target_id]
+            try:
+                sock.close()
+            except Exception:
+                pass
             return False
+        return True
+
+    def _schedule_reconnect(self, target_id: int) -> None:
+        with self._reconnect_lock:
+            if target_id in self._reconnecting or not self.running:
+                return
+            self._reconnecting.add(target_id)
+        try:
+            self._reconnect_exec.submit(self._reconnect, target_id)
+        except RuntimeError:
+            # Shut down between the running check and the submit
+            with self._reconnect_lock:
+                self._reconnecting.discard(target_id)
+
+    def _reconnect(self, target_id: int) -> None:
+        """Probe a dead peer with backoff; a successful connect revives it.
+
+        The probe socket is closed again: the peer's sender thread opens its
+        own connection on its next frame.
+        """
+        try:
+            for delay in RECONNECT_BACKOFF:
+                time.sleep(delay)
+                if not self.running or target_id not in self.dead_nodes:
+                    return
+                # The peer may have come back at a new address
+                self._peer_sockaddr[target_id] = resolve_peer(self.peers[target_id])
+                sock = self._connect(target_id)
+                if sock is not None:
+                    sock.close()
+                    return
+        finally:
+            with self._reconnect_lock:
+                self._reconnecting.discard(target_id)
 
     def send_message(
-        self, target_id: int, msg_type: MessageType, **kwargs: Any
+        self,
+        target_id: int,
+        msg_type: MessageType,
+        timestamp: Optional[int] = None,
+        extra: int = 0,
     ) -> None:
-        if target_id not in self.peers:
-            return
+        """Queue one message to a peer and return without waiting for the send.
 
-        if msg_type == MessageType.HEARTBEAT and target_id in self.dead_nodes:
+        Replies are sent from the listener loop, which must not stall on a slow
+        or dead peer, so delivery runs on that peer's sender thread.
+        """
+        if not self.running:
+            return
+        if timestamp is None:
+            timestamp = self.tick()
+        frame = MSG_FRAME.pack(msg_type, self.node_id, timestamp, extra)
+        self._enqueue(target_id, msg_type, frame)
+
+    def _enqueue(self, target_id: int, msg_type: MessageType, frame: bytes) -> None:
+        send_queue = self._send_queues.get(target_id)
+        if send_queue is None:
             return
+        if msg_type == MessageType.HEARTBEAT and not send_queue.empty():
+            # Frames already waiting prove liveness once delivered, and skipping
+            # keeps a stalled peer's queue from growing every period
+            return
+        send_queue.put((msg_type, frame))
 
-        msg: Dict[str, Any] = {
-            "sender": self.node_id,
-            "type": msg_type.value,
-            "timestamp": self.tick(),
-            **kwargs,
-        }
-        json_data = json.dumps(msg).encode("utf-8")
+    def _run_sender(
+        self,
+        target_id: int,
+        send_queue: queue.SimpleQueue[Optional[Tuple[MessageType, bytes]]],
+    ) -> None:
+        sock: Optional[socket.socket] = None
+        try:
+            while True:
+                item = send_queue.get()
+                if item is None:
+                    return
+                sock = self._deliver(target_id, *item, sock)
+        finally:
+            if sock is not None:
+                sock.close()
+
+    def _deliver(
+        self,
+        target_id: int,
+        msg_type: MessageType,
+        frame: bytes,
+        sock: Optional[socket.socket],
+    ) -> Optional[socket.socket]:
+        """Send a packed frame on the sender's socket, reconnecting once if it
+        went stale; on failure mark the peer dead and reconnect in the
+        background. Returns the socket the sender should keep."""
+        if msg_type == MessageType.HEARTBEAT and target_id in self.dead_nodes:
+            return sock
 
-        for _ in range(2):
-            if self._try_send(target_id, json_data):
-                return
+        if sock is not None and self._send_on(sock, frame):
+            return sock
+        sock = self._connect(target_id)
+        if sock is not None and self._send_on(sock, frame):
+            return sock
 
-        if target_id not in self.dead_nodes:
-            self.dead_nodes.add(target_id)
+        if self.dead_nodes.add(target_id):
             self.cw_logger.log_event(
                 "NODE_DOWN",
                 f"Failed to send message to {target_id}. Marking as dead.",
                 self.lamport_clock,
             )
-            with self.mutex_lock:
-                if self.state == NodeState.WANTED:
-                    self._maybe_signal_replies_complete()
-
-    def handle_client_connection(
-        self, client_sock: socket.socket, addr: Tuple[str, int]
+            with self.replies_cond:
+                if self.state == NodeState.WANTED and self._replies_complete():
+                    self.replies_cond.notify_all()
+        self._schedule_reconnect(target_id)
+        return None
+
+    def broadcast(
+        self,
+        peer_ids: Iterable[int],
+        msg_type: MessageType,
+        timestamp: Optional[int] = None,
     ) -> None:
-        client_sock.settimeout(None)
+        """Queue one message to several peers without waiting for the sends.
+
+        The broadcast is a single send event: it ticks the clock once and every
+        peer receives the same packed frame.
+        """
+        if not self.running:
+            return
+        if timestamp is None:
+            timestamp = self.tick()
+        frame = MSG_FRAME.pack(msg_type, self.node_id, timestamp, 0)
+        for pid in peer_ids:
+            self._enqueue(pid, msg_type, frame)
+
+    def listen(self) -> None:
+        """Serve every inbound peer connection from one selector loop."""
+        selector = selectors.DefaultSelector()
+        selector.register(self.server_socket, selectors.EVENT_READ)
         try:
             while self.running:
-                len_bytes = recv_exact(client_sock, 4)
-                if not len_bytes:
-                    break
-                msg_len = struct.unpack(">I", len_bytes)[0]
-                msg_bytes = recv_exact(client_sock, msg_len)
-                if not msg_bytes:
+                try:
+                    events = selector.select(timeout=0.5)
+                except (OSError, ValueError):
                     break
-                msg = json.loads(msg_bytes.decode("utf-8"))
-                self.process_message(msg)
-        except Exception:
-            pass
+                for key, _mask in events:
+                    if key.data is None:
+                        self._accept_connection(selector)
+                    else:
+                        self._read_frames(selector, key.fileobj, key.data)
         finally:
-            client_sock.close()
+            for key in list(selector.get_map().values()):
+                if key.data is not None:
+                    key.fileobj.close()
+            selector.close()
 
-    def listen(self) -> None:
-        while self.running:
-            try:
-                client, addr = self.server_socket.accept()
-                threading.Thread(
-                    target=self.handle_client_connection,
-                    args=(client, addr),
-                    daemon=True,
-                ).start()
-            except OSError:
-                break
-            except Exception as e:
-                self.cw_logger.log_event("LISTENER_ERROR", str(e), self.lamport_clock)
+    def _accept_connection(self, selector: selectors.BaseSelector) -> None:
+        try:
+            client, _addr = self.server_socket.accept()
+        except OSError:
+            return
+        except Exception as e:
+            self.cw_logger.log_event("LISTENER_ERROR", str(e), self.lamport_clock)
+            return
+        client.setblocking(False)
+        configure_peer_socket(client)
+        selector.register(client, selectors.EVENT_READ, ConnectionBuffer())
+
+    def _read_frames(
+        self,
+        selector: selectors.BaseSelector,
+        sock: socket.socket,
+        conn: ConnectionBuffer,
+    ) -> None:
+        try:
+            received = sock.recv_into(conn.view[conn.filled :])
+        except BlockingIOError:
+            return
+        except OSError:
+            received = 0
 
-    def process_message(self, msg: Dict[str, Any]) -> None:
-        sender: int = msg["sender"]
-        msg_type: MessageType = MessageType(msg["type"])
-        msg_time: int = msg["timestamp"]
+        filled = conn.filled + received
+        complete = filled - filled % MSG_FRAME.size
+        try:
+            if not received:
+                raise ConnectionError
+            # iter_unpack decodes every complete frame in the buffer in C
+            frames = MSG_FRAME.iter_unpack(conn.view[:complete])
+            for type_code, sender, msg_time, _extra in frames:
+                self.process_message(type_code, sender, msg_time)
+        except Exception:
+            selector.unregister(sock)
+            sock.close()
+            return
+        # Carry a partial trailing frame over to the front of the buffer
+        conn.view[: filled - complete] = conn.view[complete:filled]
+        conn.filled = filled - complete
 
+    def process_message(self, type_code: int, sender: int, msg_time: int) -> None:
         self.dead_nodes.discard(sender)
         self.update_clock(msg_time)
+        if sender == self.election_state.coordinator_id:
+            # Any frame from the leader proves it alive, not just HEARTBEAT
+            self.election_state.last_heartbeat = time.monotonic()
 
-        handlers: Dict[MessageType, Callable[[int, int], None]] = {
-            MessageType.REQUEST: self.handle_request,
-            MessageType.REPLY: self.handle_reply,
-            MessageType.ELECTION: self.handle_election,
-            MessageType.COORDINATOR: self.handle_coordinator,
-            MessageType.ANSWER: self.handle_answer,
-            MessageType.HEARTBEAT: self.handle_heartbeat,
-        }
-        handlers[msg_type](sender, msg_time)
+        self._handlers[type_code](sender, msg_time)
 
     # --- Ricart-Agrawala Mutex ---
     def request_critical_section(self) -> None:
@@ -297,9 +590,8 @@ class DistributedNode:
                 return
             self.state = NodeState.WANTED
             self.request_clock = self.tick()
-            self.replies_received.clear()
-            self.received_replies_event.clear()
-            expected_replies = self._expected_replies()
+            self.replies_mask = 0
+            expected_mask = self._live_mask()
 
         self.cw_logger.log_event(
             "MUTEX",
@@ -308,34 +600,27 @@ class DistributedNode:
             req_clock=self.request_clock,
         )
 
-        if expected_replies == 0:
+        if expected_mask == 0:
             self.enter_critical_section()
             return
 
-        dead_snapshot = self.dead_nodes.snapshot()
-        for peer_id in self.peers:
-            if peer_id != self.node_id and peer_id not in dead_snapshot:
-                self.send_message(peer_id, MessageType.REQUEST)
-
-        if self.received_replies_event.wait(timeout=MUTEX_REPLY_TIMEOUT):
-            self.enter_critical_section()
-            return
+        # Every REQUEST carries the request's own timestamp so peers order
+        # competing requests consistently
+        self.broadcast(
+            self.live_peers(), MessageType.REQUEST, timestamp=self.request_clock
+        )
 
-        with self.mutex_lock:
-            dead_snapshot = self.dead_nodes.snapshot()
-            missing_peers = {
-                pid
-                for pid in self.peers
-                if pid != self.node_id
-                and pid not in self.replies_received
-                and pid not in dead_snapshot
-            }
-            if missing_peers:
-                for pid in missing_peers:
-                    self.dead_nodes.add(pid)
-                self._maybe_signal_replies_complete()
+        with self.replies_cond:
+            complete = self.replies_cond.wait_for(
+                self._replies_complete, timeout=MUTEX_REPLY_TIMEOUT
+            )
+            if not complete:
+                for pid in self.live_peers():
+                    if not self.replies_mask & self._peer_bit[pid]:
+                        self.dead_nodes.add(pid)
+                complete = self._replies_complete()
 
-        if self.received_replies_event.is_set():
+        if complete:
             self.enter_critical_section()
         else:
             self.cw_logger.log_event(
@@ -343,8 +628,8 @@ class DistributedNode:
                 "Timeout waiting for replies. Releasing.",
                 self.lamport_clock,
             )
-            with self.mutex_lock:
-                self.state = NodeState.RELEASED
+            # Peers deferred while we were WANTED still need their REPLY
+            self.exit_critical_section()
 
     def handle_request(self, sender: int, sender_clock: int) -> None:
         """Queue or grant a mutex reply based on Lamport ordering."""
@@ -359,7 +644,7 @@ class DistributedNode:
             )
 
             if my_priority_higher:
-                self.deferred_replies.append(sender)
+                self.deferred_replies.add(sender)
             else:
                 reply = True
 
@@ -367,9 +652,10 @@ class DistributedNode:
             self.send_message(sender, MessageType.REPLY)
 
     def handle_reply(self, sender: int, _msg_time: Optional[int] = None) -> None:
-        with self.mutex_lock:
-            self.replies_received.add(sender)
-            self._maybe_signal_replies_complete()
+        with self.replies_cond:
+            self.replies_mask |= self._peer_bit.get(sender, 0)
+            if self._replies_complete():
+                self.replies_cond.notify_all()
 
     def enter_critical_section(self) -> None:
         """Simulated critical section workload."""
@@ -409,51 +695,83 @@ class DistributedNode:
     def exit_critical_section(self) -> None:
         with self.mutex_lock:
             self.state = NodeState.RELEASED
-            for deferred_node in self.deferred_replies:
-                self.send_message(deferred_node, MessageType.REPLY)
-            self.deferred_replies.clear()
+            to_reply = self.deferred_replies
+            self.deferred_replies = set()
+        # One release event, so every deferred REPLY shares its timestamp
+        if to_reply:
+            self.broadcast(to_reply, MessageType.REPLY, timestamp=self.tick())
 
     # --- Bully Election ---
     def start_election(self) -> None:
         """Run the bully election protocol to select a coordinator."""
-        if self.election_state.in_progress:
+        # Test-and-set so concurrent triggers can't start parallel elections
+        with self.election_lock:
+            if self.election_state.in_progress:
+                return
+            self.election_state.in_progress = True
+            self.election_state.answered.clear()
+        time.sleep(self._rng.uniform(0.1, 0.5))
+        if not self.election_state.in_progress:
+            # A coordinator announced itself during the jitter
             return
-        time.sleep(random.uniform(0.1, 0.5))
-        self.election_state.in_progress = True
-        self.election_state.received_answer = False
         self.cw_logger.log_event(
             "ELECTION_START", "Starting Election Process", self.tick()
         )
 
-        dead_snapshot = self.dead_nodes.snapshot()
-        higher_nodes = [
-            pid for pid in self.peers if pid > self.node_id and pid not in dead_snapshot
-        ]
+        higher_nodes = self.higher_live_peers()
 
         if not higher_nodes:
+            self._election_sent_at = {}
             self.become_coordinator()
         else:
-            for pid in higher_nodes:
-                self.send_message(pid, MessageType.ELECTION)
+            # Replace rather than update, so a previous round's stragglers
+            # can't be timed against this one
+            sent_at = time.monotonic()
+            self._election_sent_at = {pid: sent_at for pid in higher_nodes}
+            self.broadcast(higher_nodes, MessageType.ELECTION)
             threading.Thread(target=self._wait_for_election_result, daemon=True).start()
 
+    def _record_election_rtt(self, sender: int) -> None:
+        sent_at = self._election_sent_at.pop(sender, None)
+        if sent_at is None:
+            return
+        rtt = time.monotonic() - sent_at
+        # Anything slower is a late reply, not a round trip, and would pin the
+        # estimate at its cap for good
+        if rtt <= ELECTION_TIMEOUT:
+            self.rtt.add(rtt)
+
     def _wait_for_election_result(self) -> None:
-        time.sleep(ELECTION_TIMEOUT)
-        if not self.election_state.in_progress:
+        state = self.election_state
+        round_sent_at = self._election_sent_at
+        # Jitter keeps nodes that lost the same leader from timing out together
+        answered = state.answered.wait(
+            self.rtt.timeout(ELECTION_TIMEOUT) * self._rng.uniform(1.0, 2.0)
+        )
+        # Peers that haven't answered by now are lost, not slow samples; leave
+        # a newer round's timestamps alone
+        if self._election_sent_at is round_sent_at:
+            self._election_sent_at = {}
+        if not state.in_progress:
             return
 
-        if self.election_state.received_answer:
-            time.sleep(ELECTION_TIMEOUT)
-            if self.election_state.in_progress:
-                self.cw_logger.log_event(
-                    "ELECTION_RESTART",
-                    "Timeout waiting for coordinator. Restarting.",
-                    self.lamport_clock,
-                )
-                self.election_state.in_progress = False
-                self.start_election()
-        else:
+        if not answered:
             self.become_coordinator()
+            return
+
+        # The higher node has to run its own election first, so the wait for
+        # COORDINATOR is measured from its ANSWER
+        time.sleep(ELECTION_TIMEOUT * self._rng.uniform(1.0, 1.5))
+        with self.election_lock:
+            if not state.in_progress:
+                return
+            state.in_progress = False
+        self.cw_logger.log_event(
+            "ELECTION_RESTART",
+            "Timeout waiting for coordinator. Restarting.",
+            self.lamport_clock,
+        )
+        self.start_election()
 
     def handle_election(self, sender: int, _msg_time: Optional[int] = None) -> None:
         if self.election_state.coordinator_id == self.node_id:
@@ -462,19 +780,23 @@ class DistributedNode:
 
         self.send_message(sender, MessageType.ANSWER)
         if not self.election_state.in_progress:
-            self.start_election()
+            # start_election() sleeps, which would stall the listener loop
+            threading.Thread(target=self.start_election, daemon=True).start()
 
     def handle_answer(self, sender: int, _msg_time: Optional[int] = None) -> None:
-        self.election_state.received_answer = True
+        self._record_election_rtt(sender)
+        self.election_state.answered.set()
 
     def handle_coordinator(self, sender: int, _msg_time: Optional[int] = None) -> None:
+        self._record_election_rtt(sender)
         self.election_state.in_progress = False
-        self.election_state.last_heartbeat = time.time()
+        self.election_state.last_heartbeat = time.monotonic()
 
         if self.election_state.coordinator_id == sender:
             return
 
         self.election_state.coordinator_id = sender
+        self.election_state.leader_changed.set()
         self.cw_logger.log_event(
             "LEADER_UPDATE", f"New Leader is Node {sender}", self.lamport_clock
         )
@@ -482,19 +804,20 @@ class DistributedNode:
     def become_coordinator(self) -> None:
         self.election_state.coordinator_id = self.node_id
         self.election_state.in_progress = False
+        self.election_state.leader_changed.set()
         self.cw_logger.log_event(
             "LEADER_SELF", "!!! I am the Coordinator !!!", self.tick()
         )
-        for pid in self.peers:
-            if pid != self.node_id:
-                self.send_message(pid, MessageType.COORDINATOR)
+        self.broadcast(self._other_peers, MessageType.COORDINATOR)
 
     # --- Heartbeats & Liveness ---
     def handle_heartbeat(self, sender: int, _msg_time: Optional[int] = None) -> None:
-        if self.election_state.coordinator_id == sender:
-            self.election_state.last_heartbeat = time.time()
-        elif self.election_state.coordinator_id is None:
+        # A heartbeat from the current leader was already counted in
+        # process_message
+        if self.election_state.coordinator_id is None:
+            self.election_state.last_heartbeat = time.monotonic()
             self.election_state.coordinator_id = sender
+            self.election_state.leader_changed.set()
             self.cw_logger.log_event(
                 "LEADER_RECOVER",
                 f"Accepted Leader {sender} via Heartbeat",
@@ -502,25 +825,44 @@ class DistributedNode:
             )
 
     def run_heartbeat_loop(self) -> None:
-        """Monitor and emit coordinator heartbeats with jitter."""
+        """Monitor and emit coordinator heartbeats with jitter.
+
+        Followers block on ``leader_changed`` until the leader's deadline,
+        measured from the last heartbeat, instead of polling on a fixed period.
+        """
+        leader_changed = self.election_state.leader_changed
         while self.running:
-            time.sleep(1.0 + random.uniform(0.0, 0.25))
-            if self.election_state.coordinator_id == self.node_id:
-                for pid in self.peers:
-                    if pid != self.node_id:
-                        self.send_message(pid, MessageType.HEARTBEAT)
-            elif self.election_state.coordinator_id is not None:
-                if time.time() - self.election_state.last_heartbeat > (
-                    HEARTBEAT_INTERVAL + 4
-                ):
-                    self.cw_logger.log_event(
-                        "LEADER_DEAD",
-                        f"Leader {self.election_state.coordinator_id} timed out.",
-                        self.lamport_clock,
-                    )
-                    self.dead_nodes.add(self.election_state.coordinator_id)
-                    self.election_state.coordinator_id = None
-                    self.start_election()
+            period = HEARTBEAT_INTERVAL * self._rng.uniform(1.0, 1.25)
+            # Clear before reading so a change racing with this pass still wakes us
+            leader_changed.clear()
+            coordinator_id = self.election_state.coordinator_id
+            if coordinator_id == self.node_id:
+                self.broadcast(self.live_peers(), MessageType.HEARTBEAT)
+                time.sleep(period)
+                continue
+            if coordinator_id is None:
+                leader_changed.wait(period)
+                continue
+
+            deadline = (
+                self.election_state.last_heartbeat
+                + self._leader_timeout
+                + self.rtt.timeout(0.0)
+            )
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                # Heartbeats only push the deadline back, so re-check on expiry
+                leader_changed.wait(remaining)
+                continue
+
+            self.cw_logger.log_event(
+                "LEADER_DEAD",
+                f"Leader {coordinator_id} timed out.",
+                self.lamport_clock,
+            )
+            self.dead_nodes.add(coordinator_id)
+            self.election_state.coordinator_id = None
+            self.start_election()
 
     # --- Shutdown & Lifecycle ---
     def shutdown(self) -> None:
@@ -528,24 +870,23 @@ class DistributedNode:
         if not self.running:
             return
         self.running = False
+        self.election_state.leader_changed.set()
         try:
             self.server_socket.close()
         except Exception:
             pass
-        with self.conn_lock:
-            for sock in self.peer_connections.values():
-                try:
-                    sock.close()
-                except Exception:
-                    pass
-            self.peer_connections.clear()
+        for send_queue in self._send_queues.values():
+            send_queue.put(None)
+        self._reconnect_exec.shutdown(wait=False, cancel_futures=True)
         self.cw_logger.log_event(
             "SYSTEM", "Node shutdown complete.", self.lamport_clock
         )
+        self.cw_logger.close()
 
-    def _maybe_signal_replies_complete(self) -> None:
-        if len(self.replies_received) >= self._expected_replies():
-            self.received_replies_event.set()
+    def _replies_complete(self) -> bool:
+        """Whether every live peer has replied; call with mutex_lock held."""
+        expected_mask = self._live_mask()
+        return (self.replies_mask & expected_mask) == expected_mask
 
 
 def parse_args() -> tuple[int, dict[int, PeerAddress]]:
@@ -596,7 +937,7 @@ def run_repl(node: "DistributedNode") -> None:
                 node.start_election()
             elif cmd == "status":
                 print(
-                    f"Leader: {node.election_state.coordinator_id}, State: {node.state}, Clock: {node.lamport_clock}"
+                    f"Leader: {node.election_state.coordinator_id}, State: {node.state.name}, Clock: {node.lamport_clock}"
                 )
             elif cmd in {"quit", "kill", "exit"}:
                 raise KeyboardInterrupt